@@ -4,6 +4,12 @@ from .generator import load_image, generate_favicon, FAVICON_SIZES
 from .metadata import generate_html_metadata, generate_manifest, save_manifest
 from .optimizer import optimize_with_squoosh
 from .utils import validate_image_dimensions, ensure_output_dir, get_image_format
+from .preflight import (
+    preflight_image,
+    preflight_images,
+    collect_image_paths,
+    write_preflight_report,
+)
 
 __version__ = "0.2.0"
 __all__ = [
@@ -16,5 +22,9 @@ __all__ = [
     'validate_image_dimensions',
     'ensure_output_dir',
     'get_image_format',
+    'preflight_image',
+    'preflight_images',
+    'collect_image_paths',
+    'write_preflight_report',
     'FAVICON_SIZES',
 ]
\ No newline at end of file
@@ -1,6 +1,7 @@
 """Command-line interface for favicon generator."""
+import sys
 from pathlib import Path
-from typing import Optional
+from typing import List, Optional
 
 import typer
 from rich.console import Console
@@ -16,6 +17,9 @@ from . import (
     optimize_with_squoosh,
     validate_image_dimensions,
     ensure_output_dir,
+    preflight_images,
+    collect_image_paths,
+    write_preflight_report,
     FAVICON_SIZES
 )
 
@@ -175,6 +179,60 @@ def generate(
     console.print("\n[dim]Tip: Add the contents of metadata.html to your website's <head> section.[/dim]")
 
 
+@app.command()
+def preflight(
+    paths: List[str] = typer.Argument(..., help="Image files or directories to check (directories are searched recursively)"),
+    report: Optional[str] = typer.Option(
+        None,
+        "--report", "-r",
+        help="Write the JSONL report to this file instead of stdout"
+    ),
+    workers: Optional[int] = typer.Option(
+        None,
+        "--workers", "-w",
+        min=1,
+        help="Number of parallel worker threads"
+    ),
+    min_size: int = typer.Option(
+        512,
+        "--min-size",
+        help="Minimum width and height in pixels"
+    ),
+    require_alpha: bool = typer.Option(
+        False,
+        "--require-alpha",
+        help="Report images without an alpha channel as issues"
+    ),
+):
+    """Check images using only their headers and output a JSONL report."""
+    # The report may go to stdout, so keep status messages on stderr
+    err_console = Console(stderr=True)
+
+    image_paths = collect_image_paths(paths)
+    if not image_paths:
+        err_console.print("[red]No images found[/red]")
+        raise typer.Exit(1)
+
+    records = preflight_images(
+        image_paths,
+        workers=workers,
+        min_size=min_size,
+        require_alpha=require_alpha
+    )
+
+    if report:
+        with open(report, "w", encoding="utf-8") as f:
+            write_preflight_report(records, f)
+    else:
+        write_preflight_report(records, sys.stdout)
+
+    failed = sum(1 for record in records if not record["ok"])
+    if failed:
+        err_console.print(f"[yellow]{failed} of {len(records)} images have issues[/yellow]")
+        raise typer.Exit(1)
+    err_console.print(f"[green]✓ All {len(records)} images passed preflight[/green]")
+
+
 @app.command()
 def version():
     """Show version information."""
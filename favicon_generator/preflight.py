@@ -0,0 +1,209 @@
+"""Header-only preflight checks for large image collections."""
+import json
+import re
+import warnings
+import xml.etree.ElementTree as ET
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, IO, Iterable, List, Optional, Tuple
+
+from PIL import Image, UnidentifiedImageError
+
+from .utils import get_image_format
+
+# Same threshold used by validate_image_dimensions
+MIN_IMAGE_SIZE = 512
+
+# Extensions whose upper-cased name differs from the format Pillow reports
+_EXTENSION_FORMATS = {
+    'JPG': 'JPEG',
+}
+
+_ALPHA_MODES = ('RGBA', 'LA', 'PA', 'RGBa', 'La')
+
+
+def _parse_svg_length(value: Optional[str]) -> Optional[float]:
+    """Parse an SVG width/height attribute, ignoring px units."""
+    if not value:
+        return None
+    match = re.fullmatch(r'\s*([0-9]*\.?[0-9]+)\s*(px)?\s*', value)
+    return float(match.group(1)) if match else None
+
+
+def _read_svg_header(path: Path) -> Tuple[int, int]:
+    """Read the intrinsic size of an SVG from its root element only.
+
+    Args:
+        path: Path to the SVG file
+
+    Returns:
+        Tuple of (width, height)
+
+    Raises:
+        ValueError: If the file is not an SVG or has no usable size
+    """
+    for _, elem in ET.iterparse(str(path), events=('start',)):
+        if elem.tag.rsplit('}', 1)[-1] != 'svg':
+            raise ValueError("root element is not <svg>")
+        width = _parse_svg_length(elem.get('width'))
+        height = _parse_svg_length(elem.get('height'))
+        view_box = elem.get('viewBox')
+        if (width is None or height is None) and view_box:
+            parts = re.split(r'[\s,]+', view_box.strip())
+            if len(parts) == 4:
+                width, height = float(parts[2]), float(parts[3])
+        if width is None or height is None:
+            raise ValueError("SVG has no viewBox or width/height")
+        return round(width), round(height)
+    raise ValueError("empty SVG document")
+
+
+def _looks_like_xml(path: Path) -> bool:
+    """Check whether a file starts like an XML/SVG document."""
+    with open(path, 'rb') as f:
+        head = f.read(256)
+    return head.lstrip(b'\xef\xbb\xbf \t\r\n').startswith(b'<')
+
+
+def _read_header(path: Path) -> Tuple[str, int, int, bool]:
+    """Read format, size and alpha presence without decoding pixel data.
+
+    Args:
+        path: Path to the image file
+
+    Returns:
+        Tuple of (format, width, height, has_alpha)
+    """
+    try:
+        with Image.open(path) as img:
+            has_alpha = img.mode in _ALPHA_MODES or 'transparency' in img.info
+            return img.format, img.width, img.height, has_alpha
+    except UnidentifiedImageError:
+        # SVG is the only other input we accept; keep Pillow's error otherwise
+        if path.suffix.lower() != '.svg' and not _looks_like_xml(path):
+            raise
+        width, height = _read_svg_header(path)
+        return 'SVG', width, height, True
+
+
+def _check_image(image_path: str, min_size: int, require_alpha: bool) -> Dict[str, Any]:
+    """Build the report record for a single image."""
+    path = Path(image_path)
+    ext_format = get_image_format(image_path)
+    ext_format = _EXTENSION_FORMATS.get(ext_format, ext_format)
+    record: Dict[str, Any] = {
+        'path': str(path),
+        'extension_format': ext_format,
+        'format': None,
+        'width': None,
+        'height': None,
+        'has_alpha': None,
+        'issues': [],
+    }
+    issues = record['issues']
+
+    try:
+        fmt, width, height, has_alpha = _read_header(path)
+    except Image.DecompressionBombError as e:
+        issues.append('decompression_bomb')
+        record['error'] = str(e)
+    except Exception as e:
+        issues.append('unreadable')
+        record['error'] = str(e)
+    else:
+        record.update(format=fmt, width=width, height=height, has_alpha=has_alpha)
+        if fmt != ext_format:
+            issues.append('format_mismatch')
+        if width != height:
+            issues.append('not_square')
+        if width < min_size or height < min_size:
+            issues.append('too_small')
+        if require_alpha and not has_alpha:
+            issues.append('no_alpha')
+        max_pixels = Image.MAX_IMAGE_PIXELS
+        if max_pixels and width * height > max_pixels:
+            issues.append('decompression_bomb')
+
+    record['ok'] = not issues
+    return record
+
+
+def preflight_image(
+    image_path: str,
+    min_size: int = MIN_IMAGE_SIZE,
+    require_alpha: bool = False
+) -> Dict[str, Any]:
+    """Check a single image using only its header.
+
+    Args:
+        image_path: Path to the image file
+        min_size: Minimum width and height in pixels
+        require_alpha: Whether a missing alpha channel counts as an issue
+
+    Returns:
+        Report record with the detected properties and a list of issues
+    """
+    # Oversized images are reported as issues, so Pillow's warning is redundant
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore', Image.DecompressionBombWarning)
+        return _check_image(image_path, min_size, require_alpha)
+
+
+def preflight_images(
+    image_paths: Iterable[str],
+    workers: Optional[int] = None,
+    min_size: int = MIN_IMAGE_SIZE,
+    require_alpha: bool = False
+) -> List[Dict[str, Any]]:
+    """Check many images in parallel using only their headers.
+
+    Args:
+        image_paths: Paths to the image files
+        workers: Number of worker threads (defaults to the executor's choice)
+        min_size: Minimum width and height in pixels
+        require_alpha: Whether a missing alpha channel counts as an issue
+
+    Returns:
+        List of report records, in the same order as image_paths
+    """
+    # catch_warnings swaps process-wide state, so it must not run in the workers
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore', Image.DecompressionBombWarning)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(
+                lambda p: _check_image(p, min_size, require_alpha),
+                image_paths
+            ))
+
+
+def collect_image_paths(paths: Iterable[str]) -> List[str]:
+    """Expand directories into the supported image files they contain.
+
+    Args:
+        paths: Files and/or directories; directories are searched recursively
+
+    Returns:
+        Sorted list of image file paths
+    """
+    found = []
+    for entry in paths:
+        path = Path(entry)
+        if path.is_dir():
+            found.extend(
+                str(p) for p in sorted(path.rglob('*'))
+                if p.is_file() and get_image_format(str(p))
+            )
+        else:
+            found.append(str(path))
+    return found
+
+
+def write_preflight_report(records: Iterable[Dict[str, Any]], stream: IO[str]) -> None:
+    """Write report records as JSON Lines.
+
+    Args:
+        records: Records returned by preflight_image/preflight_images
+        stream: Text stream to write to
+    """
+    for record in records:
+        stream.write(json.dumps(record, ensure_ascii=False) + "\n")
@@ -1,6 +1,8 @@
 """Tests for favicon generator."""
+import json
 import os
 import shutil
+import warnings
 from pathlib import Path
 from unittest.mock import patch, MagicMock
 
@@ -9,6 +11,10 @@ from PIL import Image
 
 from favicon_generator.generator import generate_favicon, load_image, FAVICON_SIZES
 from favicon_generator.utils import validate_image_dimensions
+from typer.testing import CliRunner
+
+from favicon_generator.cli import app
+from favicon_generator.preflight import preflight_image, preflight_images, collect_image_paths
 
 
 def create_test_image(path: str, size: tuple[int, int] = (512, 512)) -> None:
@@ -129,3 +135,166 @@ class TestValidation:
         is_valid, message = validate_image_dimensions(img)
         assert is_valid is False
         assert "menor que 512x512" in message
+
+
+class TestPreflight:
+    """Test header-only preflight checks."""
+
+    def test_preflight_valid_png(self, tmp_path):
+        """Test a square, large enough PNG passes."""
+        path = tmp_path / "logo.png"
+        Image.new('RGBA', (512, 512)).save(path)
+        record = preflight_image(str(path))
+        assert record['ok'] is True
+        assert record['format'] == 'PNG'
+        assert record['has_alpha'] is True
+        assert record['issues'] == []
+
+    def test_preflight_not_square_and_small(self, tmp_path):
+        """Test squareness and minimum size are reported."""
+        path = tmp_path / "logo.png"
+        create_test_image(str(path), (256, 128))
+        record = preflight_image(str(path))
+        assert record['ok'] is False
+        assert 'not_square' in record['issues']
+        assert 'too_small' in record['issues']
+
+    def test_preflight_format_mismatch(self, tmp_path):
+        """Test a JPEG saved with a .png extension is detected."""
+        path = tmp_path / "logo.png"
+        Image.new('RGB', (512, 512)).save(path, format='JPEG')
+        record = preflight_image(str(path))
+        assert record['format'] == 'JPEG'
+        assert record['extension_format'] == 'PNG'
+        assert 'format_mismatch' in record['issues']
+
+    def test_preflight_jpg_extension(self, tmp_path):
+        """Test .jpg files are not reported as mismatched."""
+        path = tmp_path / "logo.jpg"
+        create_test_image(str(path))
+        record = preflight_image(str(path))
+        assert record['ok'] is True
+
+    def test_preflight_require_alpha(self, tmp_path):
+        """Test missing alpha is only an issue when required."""
+        path = tmp_path / "logo.png"
+        create_test_image(str(path))
+        assert preflight_image(str(path))['ok'] is True
+        record = preflight_image(str(path), require_alpha=True)
+        assert record['has_alpha'] is False
+        assert 'no_alpha' in record['issues']
+
+    def test_preflight_decompression_bomb(self, tmp_path):
+        """Test images above Pillow's pixel limit are flagged."""
+        path = tmp_path / "logo.png"
+        create_test_image(str(path), (1024, 1024))
+        with patch.object(Image, 'MAX_IMAGE_PIXELS', 1024 * 1024 - 1):
+            record = preflight_image(str(path))
+        assert 'decompression_bomb' in record['issues']
+
+    def test_preflight_svg_viewbox(self, tmp_path):
+        """Test SVG size is read from the viewBox."""
+        path = tmp_path / "logo.svg"
+        path.write_text('<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 600 600"></svg>')
+        record = preflight_image(str(path))
+        assert record['format'] == 'SVG'
+        assert (record['width'], record['height']) == (600, 600)
+        assert record['ok'] is True
+
+    def test_preflight_unreadable(self, tmp_path):
+        """Test files that are not images are reported."""
+        path = tmp_path / "logo.png"
+        path.write_bytes(b'not an image')
+        record = preflight_image(str(path))
+        assert record['issues'] == ['unreadable']
+        assert 'cannot identify image file' in record['error']
+
+    def test_preflight_unreadable_svg(self, tmp_path):
+        """Test broken SVGs report the XML parser error."""
+        path = tmp_path / "logo.svg"
+        path.write_text('<svg')
+        record = preflight_image(str(path))
+        assert record['issues'] == ['unreadable']
+        assert record['format'] is None
+
+    def test_preflight_decompression_bomb_error(self, tmp_path):
+        """Test images Pillow refuses to open are reported as bombs."""
+        path = tmp_path / "logo.png"
+        create_test_image(str(path), (1024, 1024))
+        with patch.object(Image, 'MAX_IMAGE_PIXELS', 1024 * 1024 // 2 - 1):
+            record = preflight_image(str(path))
+        assert record['issues'] == ['decompression_bomb']
+        assert record['width'] is None
+        assert 'error' in record
+
+    def test_preflight_images_keeps_warning_filters(self, tmp_path):
+        """Test parallel scans leave the process-wide warning filters intact."""
+        paths = []
+        for i in range(32):
+            path = tmp_path / f"logo{i}.png"
+            create_test_image(str(path), (64, 64))
+            paths.append(str(path))
+        before = list(warnings.filters)
+        with patch.object(Image, 'MAX_IMAGE_PIXELS', 64 * 64 - 1):
+            records = preflight_images(paths, workers=8)
+        assert list(warnings.filters) == before
+        assert all('decompression_bomb' in r['issues'] for r in records)
+
+    def test_preflight_images_directory(self, tmp_path):
+        """Test directories are expanded and results keep their order."""
+        (tmp_path / "sub").mkdir()
+        create_test_image(str(tmp_path / "a.png"))
+        create_test_image(str(tmp_path / "sub" / "b.png"), (256, 256))
+        (tmp_path / "notes.txt").write_text("ignored")
+        paths = collect_image_paths([str(tmp_path)])
+        assert [Path(p).name for p in paths] == ['a.png', 'b.png']
+        records = preflight_images(paths, workers=2)
+        assert [r['ok'] for r in records] == [True, False]
+
+
+class TestPreflightCli:
+    """Test the preflight command."""
+
+    runner = CliRunner()
+
+    def test_preflight_passing(self, tmp_path):
+        """Test the report goes to stdout and status to stderr."""
+        create_test_image(str(tmp_path / "logo.png"))
+        result = self.runner.invoke(app, ["preflight", str(tmp_path)])
+        assert result.exit_code == 0
+        records = [json.loads(line) for line in result.stdout.splitlines()]
+        assert len(records) == 1
+        assert records[0]['ok'] is True
+        assert "passed preflight" in result.stderr
+
+    def test_preflight_failing(self, tmp_path):
+        """Test images with issues make the command exit with status 1."""
+        create_test_image(str(tmp_path / "logo.png"), (256, 128))
+        result = self.runner.invoke(app, ["preflight", str(tmp_path)])
+        assert result.exit_code == 1
+        record = json.loads(result.stdout)
+        assert 'not_square' in record['issues']
+        assert "1 of 1 images have issues" in result.stderr
+
+    def test_preflight_report_file(self, tmp_path):
+        """Test --report writes the JSONL report to a file."""
+        image = tmp_path / "logo.png"
+        create_test_image(str(image))
+        report = tmp_path / "report.jsonl"
+        result = self.runner.invoke(app, ["preflight", str(image), "--report", str(report)])
+        assert result.exit_code == 0
+        assert result.stdout == ""
+        record = json.loads(report.read_text())
+        assert record['path'] == str(image)
+
+    def test_preflight_no_images(self, tmp_path):
+        """Test an empty directory is reported."""
+        result = self.runner.invoke(app, ["preflight", str(tmp_path)])
+        assert result.exit_code == 1
+        assert "No images found" in result.stderr
+
+    def test_preflight_invalid_workers(self, tmp_path):
+        """Test --workers must be at least 1."""
+        create_test_image(str(tmp_path / "logo.png"))
+        result = self.runner.invoke(app, ["preflight", str(tmp_path), "--workers", "0"])
+        assert result.exit_code == 2